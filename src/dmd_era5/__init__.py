@@ -12,6 +12,7 @@ from dmd_era5.dvc_tools import add_data_to_dvc, retrieve_data_from_dvc
 from dmd_era5.era5_download import download_era5_data
 from dmd_era5.slice_tools import (
     apply_delay_embedding,
+    delay_embedding_operator,
     flatten_era5_variables,
     resample_era5_dataset,
     slice_era5_dataset,
@@ -21,6 +22,7 @@ from dmd_era5.slice_tools import (
 
 __all__ = [
     "apply_delay_embedding",
+    "delay_embedding_operator",
     "flatten_era5_variables",
     "config_reader",
     "setup_logger",
@@ -1,6 +1,7 @@
 import ast
 import os
 from configparser import ConfigParser
+from functools import lru_cache
 
 from pyprojroot import here
 
@@ -13,6 +14,26 @@ logger = setup_logger("ConfigReader", "config_reader.log")
 CONFIG_PATH = os.path.join(here(), "config.ini")
 
 
+@lru_cache(maxsize=8)
+def _load(config_path: str, mtime_ns: int | None) -> ConfigParser:  # noqa: ARG001
+    """
+    Parse the configuration file, caching the parser per path and
+    modification time so that an edited file is parsed again.
+    The returned parser is shared between calls and must not be modified.
+
+    Args:
+        config_path (str): Path to the configuration file.
+        mtime_ns (int | None): Modification time of the file in nanoseconds,
+            or None if the file does not exist.
+
+    Returns:
+        ConfigParser: Parser with the contents of the configuration file.
+    """
+    parser = ConfigParser()
+    parser.read(config_path, encoding="utf-8-sig")
+    return parser
+
+
 def config_reader(section: str, config_path: str = CONFIG_PATH) -> dict:
     """
     Read the configuration file and return a dictionary object.
@@ -29,9 +50,13 @@ def config_reader(section: str, config_path: str = CONFIG_PATH) -> dict:
         Exception: If the section is not found in the configuration file.
     """
 
-    # Create parser for the configuration file
-    parser = ConfigParser()
-    parser.read(config_path, encoding="utf-8-sig")
+    # Parse the configuration file, reusing the parser if it has not changed
+    config_path = os.fspath(config_path)
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    parser = _load(config_path, mtime_ns)
 
     config_dict = {}
 
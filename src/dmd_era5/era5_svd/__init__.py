@@ -2,6 +2,7 @@ from dmd_era5.era5_svd.era5_svd import (
     add_config_attributes,
     combine_svd_results,
     main,
+    repeat_along_space,
     retrieve_era5_slice,
     retrieve_svd_results,
     svd_on_era5,
@@ -14,4 +15,5 @@ __all__ = [
     "retrieve_svd_results",
     "add_config_attributes",
     "main",
+    "repeat_along_space",
 ]
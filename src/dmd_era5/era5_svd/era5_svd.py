@@ -8,6 +8,7 @@ import numpy as np
 import xarray as xr
 from dvc.repo import Repo as DvcRepo
 from pyprojroot import here
+from scipy.sparse.linalg import LinearOperator  # type: ignore[import-untyped]
 from sklearn.utils.extmath import randomized_svd  # type: ignore[import-untyped]
 
 from dmd_era5 import (
@@ -38,6 +39,13 @@ console_handler.setFormatter(
 )
 logger.addHandler(console_handler)
 
+# Settings of the randomized SVD. The singular values of ERA5 fields decay
+# quickly, so a couple of power iterations are enough to resolve the leading
+# components, whereas sklearn's "auto" setting can make up to 7 passes over
+# the data matrix.
+RANDOMIZED_SVD_N_OVERSAMPLES = 10
+RANDOMIZED_SVD_N_ITER = 2
+
 
 def add_config_attributes(ds: xr.Dataset, parsed_config: dict) -> xr.Dataset:
     """
@@ -227,14 +235,77 @@ def retrieve_svd_results(
     return None, retrieved_from_dvc
 
 
+def repeat_along_space(da: xr.DataArray, repeats: int) -> xr.DataArray:
+    """
+    Repeat a flattened field, such as the mean or standard deviation of the
+    ERA5 slice, along the space dimension, to match the shape of the data array
+    after delay embedding. The result is the same as concatenating `repeats`
+    copies of the field along "space", but it is filled in a single allocation.
+
+    Args:
+        da (xr.DataArray): The flattened field, with dimension ("space",) and
+            coordinates "space" and "original_variable".
+        repeats (int): The number of times to repeat the field.
+
+    Returns:
+        xr.DataArray: The repeated field, with shape (n_space * repeats,).
+    """
+
+    return xr.DataArray(
+        np.tile(da.values, repeats),
+        dims=("space",),
+        coords={
+            "space": np.tile(da.coords["space"].values, repeats),
+            "original_variable": (
+                "space",
+                np.tile(da.coords["original_variable"].values, repeats),
+            ),
+        },
+        attrs=da.attrs,
+    )
+
+
+def _randomized_svd_operator(
+    A: LinearOperator, n_components: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Perform randomized SVD on a linear operator, using only products with
+    the operator and its transpose (Halko et al., 2011).
+
+    Args:
+        A (LinearOperator): The linear operator.
+        n_components (int): Number of singular values and vectors to compute.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The SVD results U, s, and V,
+        with the singular values in descending order.
+    """
+    rng = np.random.default_rng(0)
+    n_random = min(n_components + RANDOMIZED_SVD_N_OVERSAMPLES, *A.shape)
+    # Orthonormal basis for the range of A, refined by power iterations
+    # that are re-orthonormalized to preserve the weaker components
+    Q, _ = np.linalg.qr(A.matmat(rng.standard_normal((A.shape[1], n_random))))
+    for _ in range(RANDOMIZED_SVD_N_ITER):
+        Q, _ = np.linalg.qr(A.rmatmat(Q))
+        Q, _ = np.linalg.qr(A.matmat(Q))
+    # SVD of the small projection B = Q^T A
+    U_B, s, V = np.linalg.svd(A.rmatmat(Q).T, full_matrices=False)
+    U = Q @ U_B
+    return U[:, :n_components], s[:n_components], V[:n_components, :]
+
+
 def svd_on_era5(
-    da: xr.DataArray, parsed_config: dict
+    da: xr.DataArray | LinearOperator, parsed_config: dict
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Perform Singular Value Decomposition (SVD) on the pre-processed ERA5 slice.
 
     Args:
-        da (xr.DataArray): The pre-processed ERA5 slice.
+        da (xr.DataArray | LinearOperator): The pre-processed ERA5 slice, or
+            a linear operator representing it (e.g. from
+            `delay_embedding_operator`). A linear operator only supports
+            the "randomized" svd_type, computed from products with the
+            operator and its transpose.
         parsed_config (dict): The parsed configuration dictionary.
 
     Returns:
@@ -243,9 +314,23 @@ def svd_on_era5(
         and s is the singular values. U has shape (n_samples, n_components),
         s has shape (n_components,), and V has shape (n_components, n_features).
     """
-    X = da.values
     svd_type = parsed_config["svd_type"]
     n_components = parsed_config["n_components"]
+    if isinstance(da, LinearOperator):
+        if svd_type != "randomized":
+            msg = f"SVD type {svd_type} is not supported for a linear operator."
+            raise ValueError(msg)
+        if n_components > min(da.shape):
+            msg = f"""
+            Number of components ({n_components}) exceeds the smallest
+            dimension of the linear operator {da.shape}.
+            """
+            raise ValueError(msg)
+        log_and_print(logger, "Performing randomized SVD on linear operator...")
+        U, s, V = _randomized_svd_operator(da, n_components)
+        log_and_print(logger, "Randomized SVD complete.")
+        return U, s, V
+    X = da.values
     if svd_type == "standard":
         log_and_print(logger, "Performing standard SVD...")
         U, s, V = np.linalg.svd(X, full_matrices=False)
@@ -255,7 +340,15 @@ def svd_on_era5(
         log_and_print(logger, "Standard SVD complete.")
     elif parsed_config["svd_type"] == "randomized":
         log_and_print(logger, "Performing randomized SVD...")
-        U, s, V = randomized_svd(X, n_components=n_components)
+        # Re-orthonormalize between power iterations, otherwise the weaker
+        # components are lost to round-off
+        U, s, V = randomized_svd(
+            X,
+            n_components=n_components,
+            n_oversamples=RANDOMIZED_SVD_N_OVERSAMPLES,
+            n_iter=RANDOMIZED_SVD_N_ITER,
+            power_iteration_normalizer="QR",
+        )
         log_and_print(logger, "Randomized SVD complete.")
     else:
         msg = f"SVD type {svd_type} is not supported."
@@ -398,14 +491,13 @@ def main(
             # Repeat the mean and standard deviation along the space dimension
             # to match the shape of the data array after delay embedding
             if ds_mean and parsed_config["delay_embedding"] > 1:
-                da_mean = flatten_era5_variables(ds_mean)
-                da_mean = xr.concat(
-                    [da_mean] * parsed_config["delay_embedding"], dim="space"
+                da_mean = repeat_along_space(
+                    flatten_era5_variables(ds_mean), parsed_config["delay_embedding"]
                 )
                 if ds_std:
-                    da_std = flatten_era5_variables(ds_std)
-                    da_std = xr.concat(
-                        [da_std] * parsed_config["delay_embedding"], dim="space"
+                    da_std = repeat_along_space(
+                        flatten_era5_variables(ds_std),
+                        parsed_config["delay_embedding"],
                     )
                 else:
                     da_std = None
@@ -414,8 +506,17 @@ def main(
                 da_std = None
             U, s, V = svd_on_era5(da, parsed_config)
             if parsed_config["save_data_matrix"]:
+                # Save the data matrix, by far the largest variable, in single
+                # precision. This is a no-op for ERA5 data, which stays single
+                # precision throughout the pre-processing.
                 svd_results = combine_svd_results(
-                    U, s, V, da.coords, X=da, X_mean=da_mean, X_std=da_std
+                    U,
+                    s,
+                    V,
+                    da.coords,
+                    X=da.astype(np.float32, copy=False),
+                    X_mean=da_mean,
+                    X_std=da_std,
                 )
             else:
                 svd_results = combine_svd_results(
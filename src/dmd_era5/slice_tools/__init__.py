@@ -1,6 +1,9 @@
 from dmd_era5.slice_tools.slice_tools import (
     _apply_delay_embedding_np,
+    _delay_embedding_view,
+    _materialize_delay_embedding,
     apply_delay_embedding,
+    delay_embedding_operator,
     flatten_era5_variables,
     resample_era5_dataset,
     slice_era5_dataset,
@@ -13,7 +16,10 @@ __all__ = [
     "resample_era5_dataset",
     "standardize_data",
     "apply_delay_embedding",
+    "delay_embedding_operator",
     "flatten_era5_variables",
     "_apply_delay_embedding_np",
+    "_delay_embedding_view",
+    "_materialize_delay_embedding",
     "space_coord_to_level_lat_lon",
 ]
@@ -2,9 +2,12 @@ import logging
 import sys
 from datetime import datetime, timedelta
 
+import dask.array as dask_array
 import numpy as np
+import pandas as pd
 import xarray as xr
 from numpy.lib.stride_tricks import sliding_window_view
+from scipy.sparse.linalg import LinearOperator  # type: ignore[import-untyped]
 
 from dmd_era5.core import log_and_print, setup_logger
 
@@ -65,19 +68,24 @@ def slice_era5_dataset(
     # Get dataset time bounds
     time_bounds = _get_dataset_time_bounds(ds)
 
-    # Use dataset bounds if no times specified
-    start_dt = start_dt or time_bounds["first"]
-    end_dt = end_dt or time_bounds["last"]
+    # Use dataset bounds if no times specified, keeping all the
+    # comparisons below in NumPy's datetime64 type
+    start_dt64 = time_bounds["first"] if start_dt is None else np.datetime64(start_dt)
+    end_dt64 = time_bounds["last"] if end_dt is None else np.datetime64(end_dt)
 
     # Validate time range is within dataset bounds
-    if start_dt < time_bounds["first"] or end_dt > time_bounds["last"]:
-        msg = f"Time range ({start_dt} to {end_dt}) is outside dataset"
-        msg += f"bounds ({time_bounds['first']} to {time_bounds['last']})."
+    if start_dt64 < time_bounds["first"] or end_dt64 > time_bounds["last"]:
+        start_str, end_str, first_str, last_str = np.datetime_as_string(
+            [start_dt64, end_dt64, time_bounds["first"], time_bounds["last"]],
+            unit="s",
+        )
+        msg = f"Time range ({start_str} to {end_str}) is outside dataset "
+        msg += f"bounds ({first_str} to {last_str})."
         log_and_print(logger, msg, "error")
         raise ValueError(msg)
 
     # Validate the start is before the end datetime
-    if start_dt >= end_dt:
+    if start_dt64 >= end_dt64:
         msg = "Start datetime must be before end datetime."
         log_and_print(logger, msg, "error")
         raise ValueError(msg)
@@ -87,11 +95,11 @@ def slice_era5_dataset(
 
     # Slice the dataset
     try:
-        sliced_ds = ds.sel(time=slice(start_dt, end_dt), level=levels)
+        sliced_ds = ds.sel(time=slice(start_dt64, end_dt64), level=levels)
         log_and_print(
             logger,
-            f"Dataset slicing completed successfully using {start_dt}"
-            f"to {end_dt} and levels {levels}",
+            f"Dataset slicing completed successfully using {start_dt64}"
+            f"to {end_dt64} and levels {levels}",
         )
         return sliced_ds
 
@@ -115,11 +123,12 @@ def _get_dataset_time_bounds(ds: xr.Dataset) -> dict:
     Returns
     -------
     dict
-        Dictionary with 'first' and 'last' datetime objects.
+        Dictionary with 'first' and 'last' np.datetime64 objects, in the
+        unit of the dataset time coordinate.
     """
     return {
-        "first": datetime.fromtimestamp(ds.time.values[0].astype(int) * 1e-9),
-        "last": datetime.fromtimestamp(ds.time.values[-1].astype(int) * 1e-9),
+        "first": ds.time.values[0],
+        "last": ds.time.values[-1],
     }
 
 
@@ -136,11 +145,52 @@ def resample_era5_dataset(ds: xr.Dataset, delta_time: timedelta) -> xr.Dataset:
         xr.Dataset: The resampled ERA5 dataset.
     """
 
-    resampled_ds = ds.resample(time=delta_time).nearest()
+    stride = _regular_time_stride(ds, delta_time)
+    if stride is not None:
+        # Nearest-neighbour resampling of a regular time axis onto
+        # a grid it already contains reduces to taking every stride-th time
+        resampled_ds = ds.isel(time=slice(None, None, stride))
+    else:
+        resampled_ds = ds.resample(time=delta_time).nearest()
     log_and_print(logger, f"Resampled the dataset with time delta: {delta_time}")
     return resampled_ds
 
 
+def _regular_time_stride(ds: xr.Dataset, delta_time: timedelta) -> int | None:
+    """
+    Get the stride along the time dimension equivalent to resampling
+    the dataset by a time delta, if there is one.
+
+    Parameters
+    ----------
+    ds : xr.Dataset
+        The ERA5 dataset.
+    delta_time : timedelta
+        The time delta for resampling.
+
+    Returns
+    -------
+    int or None
+        The stride, if the time coordinate is increasing and regularly spaced,
+        delta_time is a multiple of the spacing, and the first time lies on the
+        resampling grid (which starts at midnight of the first day).
+        Otherwise None.
+    """
+    times = ds.time.values
+    if times.size < 2:
+        return None
+    steps = np.diff(times)
+    # A descending time axis is left to xarray, which rejects it
+    if steps[0] <= np.timedelta64(0) or not np.all(steps == steps[0]):
+        return None
+    step = pd.Timedelta(steps[0])
+    delta = pd.Timedelta(delta_time)
+    first = pd.Timestamp(times[0])
+    if delta % step or (first - first.normalize()) % delta:
+        return None
+    return delta // step
+
+
 def standardize_data(
     data: xr.Dataset,
     dim: str = "time",
@@ -168,20 +218,50 @@ def standardize_data(
         logger,
         f"Removing mean along {dim} dimension...",
     )
-    mean = data.mean(dim=dim)
+    mean = _reduce_in_float64(data, dim, "mean")
     data = data - mean
     if scale:
         # Scale the data by the standard deviation
         log_and_print(logger, f"Scaling to unit variance along {dim} dimension...")
-        std = data.std(dim=dim)
-        data = data / std
+        std = _reduce_in_float64(data, dim, "std")
+        # Scale in place: the centered data is already a new array, so
+        # there is no need to allocate (and write) another full-size copy
+        data /= std
         return data, mean, std
     return data, mean, None
 
 
-def _apply_delay_embedding_np(X: np.ndarray, d: int) -> np.ndarray:
+def _reduce_in_float64(data: xr.Dataset, dim: str, reduction: str) -> xr.Dataset:
     """
-    Apply delay embedding to temporal snapshots.
+    Reduce the input Dataset along the specified dimension, accumulating in
+    double precision but returning floating-point variables in their original
+    precision. ERA5 data is single precision, so this keeps the statistics
+    accurate without promoting the standardized data to float64.
+
+    Args:
+        data (xr.Dataset): The input data to reduce.
+        dim (str): The dimension along which to reduce.
+        reduction (str): The name of the reduction, e.g. "mean" or "std".
+
+    Returns:
+        xr.Dataset: The reduced data.
+    """
+
+    # Reduce the whole Dataset, so that variables without the dimension
+    # are skipped rather than raising
+    reduced = getattr(data, reduction)(dim=dim, dtype=np.float64)
+    return reduced.assign(
+        {
+            name: reduced[name].astype(data[name].dtype)
+            for name in reduced.data_vars
+            if np.issubdtype(data[name].dtype, np.floating)
+        }
+    )
+
+
+def _check_delay_embedding_args(X: np.ndarray, d: int) -> None:
+    """
+    Check the arguments of a delay embedding of temporal snapshots.
 
     Parameters
     ----------
@@ -190,10 +270,10 @@ def _apply_delay_embedding_np(X: np.ndarray, d: int) -> np.ndarray:
     d : int
         The number of snapshots from X to include in each snapshot of the output.
 
-    Returns
-    -------
-    np.ndarray
-        The delay-embedded data array of shape (n_samples * d, n_time - d + 1).
+    Raises
+    ------
+    ValueError
+        If X is not 2D, or d is not an integer between 1 and n_time.
     """
 
     if X.ndim != 2:
@@ -204,10 +284,134 @@ def _apply_delay_embedding_np(X: np.ndarray, d: int) -> np.ndarray:
         msg = "Delay must be an integer greater than 0."
         raise ValueError(msg)
 
-    return (
-        sliding_window_view(X.T, (d, X.shape[0]))[:, 0]
-        .reshape(X.shape[1] - d + 1, -1)
-        .T
+    if d > X.shape[1]:
+        msg = "Delay must not exceed the number of snapshots."
+        raise ValueError(msg)
+
+
+def _delay_embedding_view(X: np.ndarray, d: int) -> np.ndarray:
+    """
+    Return a zero-copy, read-only view of the delay embedding of
+    temporal snapshots.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        The input data array of shape (n_samples, n_time).
+    d : int
+        The number of snapshots from X to include in each snapshot of the output.
+
+    Returns
+    -------
+    np.ndarray
+        A read-only view of X with shape (d, n_samples, n_time - d + 1), where
+        block k holds the snapshots X[:, k : n_time - d + 1 + k]. Stacking the
+        blocks along the first axis gives the delay-embedded data array
+        (see `_materialize_delay_embedding`).
+    """
+
+    _check_delay_embedding_args(X, d)
+
+    view = np.moveaxis(sliding_window_view(X, window_shape=d, axis=1), -1, 0)
+    view.flags.writeable = False
+    return view
+
+
+def _materialize_delay_embedding(view: np.ndarray) -> np.ndarray:
+    """
+    Copy a delay embedding view into a contiguous 2D array.
+
+    Parameters
+    ----------
+    view : np.ndarray
+        The delay embedding view of shape (d, n_samples, n_time - d + 1),
+        as returned by `_delay_embedding_view`.
+
+    Returns
+    -------
+    np.ndarray
+        The delay-embedded data array of shape (n_samples * d, n_time - d + 1).
+    """
+    d, n_samples, n_cols = view.shape
+    return np.ascontiguousarray(view).reshape(d * n_samples, n_cols)
+
+
+def _apply_delay_embedding_np(X: np.ndarray, d: int) -> np.ndarray:
+    """
+    Apply delay embedding to temporal snapshots.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        The input data array of shape (n_samples, n_time).
+    d : int
+        The number of snapshots from X to include in each snapshot of the output.
+
+    Returns
+    -------
+    np.ndarray
+        The delay-embedded data array of shape (n_samples * d, n_time - d + 1).
+    """
+
+    return _materialize_delay_embedding(_delay_embedding_view(X, d))
+
+
+def delay_embedding_operator(X: np.ndarray, d: int) -> LinearOperator:
+    """
+    Represent the delay embedding of temporal snapshots as a linear operator,
+    without materializing the delay-embedded (block-Hankel) matrix.
+
+    Products with the operator are computed as FFT-based correlations along
+    the time axis, so the storage is O(n_samples * n_time) instead of
+    O(n_samples * d * n_time). This makes it possible to compute the SVD of
+    delay-embedded data (see `svd_on_era5`) for delays where the dense matrix
+    would not fit in memory.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        The real-valued input data array of shape (n_samples, n_time).
+    d : int
+        The number of snapshots from X to include in each snapshot of the output.
+
+    Returns
+    -------
+    LinearOperator
+        A linear operator of shape (n_samples * d, n_time - d + 1), equivalent
+        to the array returned by `_apply_delay_embedding_np(X, d)`.
+    """
+
+    _check_delay_embedding_args(X, d)
+
+    n_samples, n_time = X.shape
+    n_cols = n_time - d + 1
+    # length of the full linear convolution of a row of X with a
+    # vector of length n_cols, so that the circular FFT convolution
+    # does not wrap around
+    n_fft = n_time + n_cols - 1
+    X_fft = np.fft.rfft(X, n=n_fft, axis=1)
+
+    def matvec(v: np.ndarray) -> np.ndarray:
+        # (H v)[k * n_samples + i] = sum_j X[i, j + k] v[j],
+        # i.e. the correlation of each row of X with v
+        v_fft = np.fft.rfft(np.ravel(v)[::-1], n=n_fft)
+        corr = np.fft.irfft(X_fft * v_fft, n=n_fft, axis=1)
+        return corr[:, n_cols - 1 : n_time].T.reshape(-1)
+
+    def rmatvec(u: np.ndarray) -> np.ndarray:
+        # (H^T u)[j] = sum_k sum_i X[i, j + k] u[k * n_samples + i],
+        # summing the spectra over i before a single inverse FFT
+        u_blocks = np.reshape(u, (d, n_samples)).T
+        u_fft = np.fft.rfft(u_blocks[:, ::-1], n=n_fft, axis=1)
+        corr = np.fft.irfft((X_fft * u_fft).sum(axis=0), n=n_fft)
+        return corr[d - 1 : n_time]
+
+    return LinearOperator(
+        (n_samples * d, n_cols),
+        matvec=matvec,
+        rmatvec=rmatvec,
+        # the FFT-based products are floating point, even for integer X
+        dtype=np.result_type(X.dtype, np.float32),
     )
 
 
@@ -319,23 +523,57 @@ def flatten_era5_variables(era5_ds: xr.Dataset) -> xr.DataArray:
         """
         raise ValueError(msg)
 
-    # stack the spatial dimensions
-    stacked = era5_ds.stack(space=spatial_stack_order)
-
+    # the space coordinate is the product of the spatial coordinates, in
+    # the same order as stacking the spatial dimensions would produce
+    space_coord = pd.MultiIndex.from_product(
+        [era5_ds.coords[dim].values for dim in spatial_stack_order]
+    ).to_numpy()
+    n_space = space_coord.shape[0]
+    dtype = np.result_type(*[era5_ds[var].dtype for var in variables])
+
+    # pre-allocate the combined array of shape (n_space * n_variables, n_time)
+    # or (n_space * n_variables,), and copy each variable into its own block
+    # along the space dimension, instead of concatenating per-variable copies
     if "time" in coords:
-        # create a list of variable arrays with shape (n_space, n_time)
-        data_list = [
-            stacked[var].transpose("space", "time").values for var in variables
-        ]
+        n_time = era5_ds.sizes["time"]
+        data_combined = np.empty((n_space * len(variables), n_time), dtype=dtype)
     else:
-        # create a list of variable arrays with shape (n_space,)
-        data_list = [stacked[var].values for var in variables]
-    # concatenate the variable arrays along the space dimension,
-    # resulting in an array of shape (n_space * n_variables, n_time)
-    # or (n_space * n_variables,)
-    data_combined = np.concatenate(data_list, axis=0)
-
-    variable_labels = np.repeat(variables, stacked.coords["space"].shape[0])
+        data_combined = np.empty((n_space * len(variables),), dtype=dtype)
+    dask_sources: list[dask_array.Array] = []
+    dask_targets: list[np.ndarray] = []
+    for i, var in enumerate(variables):
+        # broadcast variables without some of the spatial dimensions (e.g.
+        # single-level variables) across them, as stacking would
+        var_da = era5_ds[var].expand_dims(
+            {
+                dim: era5_ds.sizes[dim]
+                for dim in spatial_stack_order
+                if dim not in era5_ds[var].dims
+            }
+        )
+        if "time" in coords:
+            # ERA5 variables are stored time-major, so the (time, space) matrix
+            # is a contiguous reshape, and the only strided access is the
+            # transpose into the (space, time) output block
+            var_data = (
+                var_da.transpose("time", *spatial_stack_order)
+                .data.reshape(n_time, n_space)
+                .T
+            )
+        else:
+            var_data = var_da.transpose(*spatial_stack_order).data.reshape(-1)
+        if isinstance(var_data, dask_array.Array):
+            dask_sources.append(var_data)
+            dask_targets.append(data_combined[i * n_space : (i + 1) * n_space])
+        else:
+            data_combined[i * n_space : (i + 1) * n_space] = var_data
+    if dask_sources:
+        # compute all dask-backed variables in a single pass over the task
+        # graph, so chunk reads overlap across variables, and write each
+        # chunk straight into its block of the combined array
+        dask_array.store(dask_sources, dask_targets, lock=False, scheduler="threads")
+
+    variable_labels = np.repeat(variables, n_space)
 
     # create a DataArray for the combined data
     if "time" in coords:
@@ -343,8 +581,8 @@ def flatten_era5_variables(era5_ds: xr.Dataset) -> xr.DataArray:
             data_combined,
             dims=("space", "time"),
             coords={
-                "space": np.tile(stacked.coords["space"], len(variables)),
-                "time": stacked.coords["time"],
+                "space": np.tile(space_coord, len(variables)),
+                "time": era5_ds.coords["time"],
                 "original_variable": ("space", variable_labels),
             },
             attrs=era5_ds.attrs,
@@ -354,7 +592,7 @@ def flatten_era5_variables(era5_ds: xr.Dataset) -> xr.DataArray:
             data_combined,
             dims=("space",),
             coords={
-                "space": np.tile(stacked.coords["space"], len(variables)),
+                "space": np.tile(space_coord, len(variables)),
                 "original_variable": ("space", variable_labels),
             },
             attrs=era5_ds.attrs,
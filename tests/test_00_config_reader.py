@@ -3,44 +3,76 @@ Tests for the config_reader module.
 """
 
 import os
+from functools import cache, partial
+from pathlib import Path
 
 import pytest
 from pyprojroot import here
 
 from dmd_era5 import config_reader
+from dmd_era5.config_reader import _load
+
+_ROOT = Path(here())
+TEST_CONFIG_PATH = _ROOT / "tests" / "config.ini"
+ACTUAL_CONFIG_PATH = _ROOT / "config.ini"
+
+_ERA5_DOWNLOAD_REQUIRED = frozenset(
+    {
+        "source_path",
+        "start_datetime",
+        "end_datetime",
+        "delta_time",
+        "variables",
+        "levels",
+    }
+)
+_ERA5_SVD_REQUIRED = _ERA5_DOWNLOAD_REQUIRED | {
+    "mean_center",
+    "scale",
+    "svd_type",
+    "delay_embedding",
+    "n_components",
+    "save_data_matrix",
+}
+
+_SVD_TYPES = {
+    "mean_center": bool,
+    "scale": bool,
+    "save_data_matrix": bool,
+    "delay_embedding": int,
+    "n_components": int,
+}
 
 
 # ---- Fixtures ----
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_config_path():
     """Fixture for the test config path."""
-    return os.path.join(here(), "tests/config.ini")
+    return TEST_CONFIG_PATH
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def actual_config_path():
     """Fixture for the current config path in the project."""
-    return os.path.join(here(), "config.ini")
+    return ACTUAL_CONFIG_PATH
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_config_reader(test_config_path):
-    """Fixture for reading the test configuration."""
-
-    def test_config_reader(section):
-        return config_reader(section, test_config_path)
-
-    return test_config_reader
+    """
+    Fixture for reading the test configuration. Each section is read
+    once per session and shared between tests, which must not modify it.
+    """
+    return cache(partial(config_reader, config_path=test_config_path))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def actual_config_reader(actual_config_path):
-    """Fixture for reading the actual configuration."""
-
-    def actual_config_reader(section):
-        return config_reader(section, actual_config_path)
-
-    return actual_config_reader
+    """
+    Fixture for reading the actual configuration. Each section is read
+    once per session and shared between tests, which must not modify it.
+    """
+    return cache(partial(config_reader, config_path=actual_config_path))
 
 
 # ---- Tests ----
@@ -48,8 +80,8 @@ def actual_config_reader(actual_config_path):
 
 def test_config_files_exists(test_config_path, actual_config_path):
     """Test that the test and actual config files exist."""
-    assert os.path.exists(test_config_path), "Test config file does not exist."
-    assert os.path.exists(actual_config_path), "Config file does not exist in project."
+    assert test_config_path.is_file(), "Test config file does not exist."
+    assert actual_config_path.is_file(), "Config file does not exist in project."
 
 
 def test_config_reader_returns_dict(test_config_reader):
@@ -58,45 +90,43 @@ def test_config_reader_returns_dict(test_config_reader):
     assert isinstance(config, dict), "Expected config_reader to return a dictionary."
 
 
-def test_config_reader_sections(test_config_reader):
+@pytest.mark.parametrize(
+    ("section", "n_params"), [("test-section-0", 3), ("test-section-1", 5)]
+)
+def test_config_reader_sections(test_config_reader, section, n_params):
     """
     Test that the config_reader function returns the correct
     number of parameters for a given section.
     """
-    config_section_0 = test_config_reader("test-section-0")
-    assert (
-        len(config_section_0) == 3
-    ), "Expected 3 parameters in test-section-0 from test config file."
-    assert (
-        config_section_0["param_0"] == "value_0"
-    ), "Expected param_0 to be 'value_0' in test-section-0 from test config file."
-    assert (
-        config_section_0["param_1"] == "value_1"
-    ), "Expected param_1 to be 'value_1' in test-section-0 from test config file."
-    assert (
-        config_section_0["param_2"] == "value_2.0,value_2.1"
-    ), """Expected param_2 to be 'value_2.0,value_2.1'
-    in test-section-0 from test config file."""
-
-    config_section_1 = test_config_reader("test-section-1")
-    assert (
-        len(config_section_1) == 5
-    ), "Expected 5 parameters in test-section-1 from test config file."
+    config = test_config_reader(section)
     assert (
-        config_section_1["param_0"] == "value_0"
-    ), "Expected param_0 to be 'value_0' in test-section-1 from test config file."
-    assert (
-        config_section_1["param_1"] == "value_1"
-    ), "Expected param_1 to be 'value_1' in test-section-1 from test config file."
-    assert (
-        config_section_1["param_2"] == "value_2"
-    ), "Expected param_2 to be 'value_2' in test-section-1 from test config file."
-    assert (
-        config_section_1["param_3"] is True
-    ), "Expected param_3 to be True in test-section-1 from test config file."
-    assert (
-        config_section_1["param_4"] == 2
-    ), "Expected param_4 to be 2 in test-section-1 from test config file."
+        len(config) == n_params
+    ), f"Expected {n_params} parameters in {section} from test config file."
+
+
+@pytest.mark.parametrize(
+    ("section", "key", "expected"),
+    [
+        ("test-section-0", "param_0", "value_0"),
+        ("test-section-0", "param_1", "value_1"),
+        ("test-section-0", "param_2", "value_2.0,value_2.1"),
+        ("test-section-1", "param_0", "value_0"),
+        ("test-section-1", "param_1", "value_1"),
+        ("test-section-1", "param_2", "value_2"),
+        ("test-section-1", "param_3", True),
+        ("test-section-1", "param_4", 2),
+    ],
+)
+def test_config_reader_values(test_config_reader, section, key, expected):
+    """
+    Test that the config_reader function returns the correct
+    value and type for each parameter of a given section.
+    """
+    value = test_config_reader(section)[key]
+    assert type(value) is type(
+        expected
+    ), f"Expected {key} to be of type {type(expected).__name__} in {section}."
+    assert value == expected, f"Expected {key} to be {expected!r} in {section}."
 
 
 def test_config_nonexistent_section(test_config_reader):
@@ -105,37 +135,41 @@ def test_config_nonexistent_section(test_config_reader):
         test_config_reader("nonexistent-section")
 
 
+def test_config_reader_cache(tmp_path):
+    """
+    Test that the config_reader function parses an unchanged file once
+    and parses it again after it is modified.
+    """
+    config_path = tmp_path / "config.ini"
+    config_path.write_text("[section]\nparam = 1\n")
+    os.utime(config_path, ns=(0, 0))
+    misses = _load.cache_info().misses
+    assert config_reader("section", config_path) == {"param": 1}
+    assert config_reader("section", config_path) == {"param": 1}
+    assert _load.cache_info().misses == misses + 1, "Expected the file parsed once."
+
+    config_path.write_text("[section]\nparam = 2\n")
+    os.utime(config_path, ns=(1, 1))
+    assert config_reader("section", config_path) == {
+        "param": 2
+    }, "Expected the modified file to be parsed again."
+
+
 # ---- Testing Current Config ----
 
 
 def test_actual_config_era5_download_section(actual_config_reader):
     """Test the contents of era5-download section in the actual configuration."""
     config = actual_config_reader("era5-download")
-    assert "source_path" in config, "era5-download section should have a source_path"
-    assert (
-        "start_datetime" in config
-    ), "era5-download section should have a start_datetime"
-    assert "end_datetime" in config, "era5-download section should have an end_datetime"
-    assert "delta_time" in config, "era5-download section should have a delta_time"
-    assert "variables" in config, "era5-download section should have variables"
-    assert "levels" in config, "era5-download section should have levels"
+    missing = _ERA5_DOWNLOAD_REQUIRED - config.keys()
+    assert not missing, f"era5-download section is missing keys: {sorted(missing)}"
 
 
 def test_actual_config_era5_svd_section(actual_config_reader):
     """Test the contents of era5-svd section in the actual configuration."""
     config = actual_config_reader("era5-svd")
-    assert "source_path" in config, "era5-svd section should have a source_path"
-    assert "start_datetime" in config, "era5-svd section should have a start_datetime"
-    assert "end_datetime" in config, "era5-svd section should have an end_datetime"
-    assert "delta_time" in config, "era5-svd section should have a delta_time"
-    assert "variables" in config, "era5-svd section should have variables"
-    assert "levels" in config, "era5-svd section should have levels"
-    assert "mean_center" in config, "era5-svd section should have mean-center"
-    assert "scale" in config, "era5-svd section should have scale"
-    assert "svd_type" in config, "era5-svd section should have svd_type"
-    assert "delay_embedding" in config, "era5-svd section should have delay_embedding"
-    assert "n_components" in config, "era5-svd section should have n_components"
-    assert "save_data_matrix" in config, "era5-svd section should have save_data_matrix"
+    missing = _ERA5_SVD_REQUIRED - config.keys()
+    assert not missing, f"era5-svd section is missing keys: {sorted(missing)}"
 
 
 def test_actual_config_era5_download_type(actual_config_reader):
@@ -155,11 +189,5 @@ def test_actual_config_era5_svd_type(actual_config_reader):
     config = actual_config_reader("era5-svd")
 
     for key, value in config.items():
-        if key == "mean_center" or key == "scale" or key == "save_data_matrix":
-            assert isinstance(value, bool), f"Expected {key} to be a bool."
-        elif key == "svd_type":
-            assert isinstance(value, str), f"Expected {key} to be a string."
-        elif key == "delay_embedding" or key == "n_components":
-            assert isinstance(value, int), f"Expected {key} to be an int."
-        else:
-            assert isinstance(value, str), f"Expected {key} to be a string."
+        expected = _SVD_TYPES.get(key, str)
+        assert isinstance(value, expected), f"Expected {key} to be {expected.__name__}."
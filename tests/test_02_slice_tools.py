@@ -11,6 +11,7 @@ import xarray as xr
 from dmd_era5 import (
     apply_delay_embedding,
     create_mock_era5,
+    delay_embedding_operator,
     flatten_era5_variables,
     resample_era5_dataset,
     slice_era5_dataset,
@@ -18,6 +19,7 @@ from dmd_era5 import (
     standardize_data,
 )
 from dmd_era5.slice_tools import _apply_delay_embedding_np as apply_delay_embedding_np
+from dmd_era5.slice_tools import _delay_embedding_view, _materialize_delay_embedding
 
 
 @pytest.fixture
@@ -65,6 +67,24 @@ def test_slice_era5_dataset(mock_era5_temperature):
     ], "Expected levels to be [1000, 500]"
 
 
+@pytest.mark.parametrize("unit", ["ns", "us", "s"])
+def test_slice_era5_dataset_time_unit(mock_era5_temperature, unit):
+    """
+    Test that slice_era5_dataset uses the correct dataset time bounds
+    regardless of the datetime64 unit of the time coordinate.
+    """
+    ds = mock_era5_temperature.assign_coords(
+        time=mock_era5_temperature.time.values.astype(f"datetime64[{unit}]")
+    )
+    sliced_ds = slice_era5_dataset(ds, end_datetime="2019-01-04T23:00")
+    assert sliced_ds.time.min().values.astype("datetime64[us]").astype(
+        datetime
+    ) == datetime(2019, 1, 1, 0), "Expected start time to be 2019-01-01 00:00"
+    assert sliced_ds.time.max().values.astype("datetime64[us]").astype(
+        datetime
+    ) == datetime(2019, 1, 4, 23), "Expected end time to be 2019-01-04 23:00"
+
+
 def test_slice_era5_dataset_invalid_time():
     """Test the invalid time range error in the slice_era5_dataset function."""
     mock_ds = create_mock_era5(
@@ -74,7 +94,11 @@ def test_slice_era5_dataset_invalid_time():
         levels=[1000, 850, 500],
     )
 
-    with pytest.raises(ValueError, match="Time range .* is outside dataset"):
+    with pytest.raises(
+        ValueError,
+        match=r"Time range \(2018-12-31T00:00:00 to 2019-01-05T00:00:00\) is "
+        r"outside dataset bounds \(2019-01-01T00:00:00 to 2019-01-05T00:00:00\)",
+    ):
         slice_era5_dataset(
             mock_ds,
             start_datetime="2018-12-31T00:00",
@@ -82,6 +106,16 @@ def test_slice_era5_dataset_invalid_time():
         )
 
 
+def test_slice_era5_dataset_start_after_end(mock_era5_temperature):
+    """Test the start after end error in the slice_era5_dataset function."""
+    with pytest.raises(ValueError, match="Start datetime must be before end datetime"):
+        slice_era5_dataset(
+            mock_era5_temperature,
+            start_datetime="2019-01-03T00:00",
+            end_datetime="2019-01-02T00:00",
+        )
+
+
 def test_resample_era5_dataset():
     """Test that the resample_era5_dataset function correctly resamples the dataset."""
     mock_ds = create_mock_era5(
@@ -101,6 +135,35 @@ def test_resample_era5_dataset():
     ).all(), "Expected time delta to be 6 hours"
 
 
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("start_datetime", ["2019-01-01T00", "2019-01-01T01"])
+@pytest.mark.parametrize("hours", [1, 2, 5, 24])
+def test_resample_era5_dataset_matches_xarray(start_datetime, hours, descending):
+    """
+    Test that resample_era5_dataset matches nearest-neighbour resampling
+    with xarray, whether or not the time axis can be strided, and raises
+    the same error as xarray for a descending time axis.
+    """
+    mock_ds = create_mock_era5(
+        start_datetime=start_datetime,
+        end_datetime="2019-01-03T05",
+        variables=["temperature"],
+        levels=[1000],
+    )
+    delta_time = timedelta(hours=hours)
+    if descending:
+        mock_ds = mock_ds.isel(time=slice(None, None, -1))
+        with pytest.raises(ValueError, match="Index must be monotonic"):
+            mock_ds.resample(time=delta_time).nearest()
+        with pytest.raises(ValueError, match="Index must be monotonic"):
+            resample_era5_dataset(mock_ds, delta_time)
+    else:
+        resampled_ds = resample_era5_dataset(mock_ds, delta_time)
+        assert resampled_ds.identical(
+            mock_ds.resample(time=delta_time).nearest()
+        ), "Expected resampled dataset to match xarray resampling"
+
+
 @pytest.mark.parametrize(
     "data", ["mock_era5_temperature", "mock_era5_temperature_wind"]
 )
@@ -152,6 +215,34 @@ def test_standardize_data(data, request):
         )
 
 
+def test_standardize_data_float32(mock_era5_temperature):
+    """Test that standardize_data keeps single precision data in single precision."""
+    mock_era5 = mock_era5_temperature.astype(np.float32)
+    data_standardized, data_mean, data_std = standardize_data(mock_era5)
+    for ds in [data_standardized, data_mean, data_std]:
+        assert ds["temperature"].dtype == np.float32, "Expected float32 data"
+    assert np.allclose(
+        data_mean["temperature"],
+        mock_era5_temperature.mean(dim="time")["temperature"],
+        atol=1e-4,
+    ), "Expected mean to match the double precision mean"
+
+
+def test_standardize_data_variable_without_dim(mock_era5_temperature):
+    """
+    Test that standardize_data skips variables without the standardization
+    dimension when computing the mean and standard deviation.
+    """
+    mock_era5 = mock_era5_temperature.astype(np.float32)
+    mock_era5["orography"] = mock_era5["temperature"].isel(time=0, drop=True)
+    _, data_mean, data_std = standardize_data(mock_era5)
+    assert data_mean["orography"].identical(
+        mock_era5["orography"]
+    ), "Expected the mean of a variable without a time dimension to be unchanged"
+    assert data_mean["temperature"].dtype == np.float32, "Expected float32 mean"
+    assert data_std["temperature"].dtype == np.float32, "Expected float32 std"
+
+
 @pytest.mark.parametrize(
     "data", ["mock_era5_temperature", "mock_era5_temperature_wind"]
 )
@@ -262,6 +353,65 @@ def test_apply_delay_embedding_np_invalid_delay(d):
         apply_delay_embedding_np(np.zeros((3, 3)), d)
 
 
+@pytest.mark.parametrize(
+    "embedding", [apply_delay_embedding_np, delay_embedding_operator]
+)
+@pytest.mark.parametrize("d", [4, 6])
+def test_delay_embedding_delay_too_large(embedding, d):
+    """Test the delay embeddings with a delay larger than the number of snapshots."""
+    with pytest.raises(
+        ValueError, match="Delay must not exceed the number of snapshots."
+    ):
+        embedding(np.zeros((2, 3)), d)
+
+
+@pytest.mark.parametrize("d", [1, 2, 3])
+def test_delay_embedding_view(d):
+    """
+    Test that the delay embedding view shares memory with the input,
+    is read-only, and materializes to the delay-embedded matrix.
+    """
+    X = np.arange(15.0).reshape(3, 5)
+    view = _delay_embedding_view(X, d)
+    assert view.shape == (d, 3, 5 - d + 1), "Unexpected view shape"
+    assert np.shares_memory(view, X), "Expected view to share memory with input"
+    assert not view.flags.writeable, "Expected view to be read-only"
+    assert np.array_equal(
+        _materialize_delay_embedding(view), apply_delay_embedding_np(X, d)
+    ), "Expected materialized view to match the delay-embedded matrix"
+
+
+@pytest.mark.parametrize("d", [1, 2, 5])
+def test_delay_embedding_operator(d):
+    """
+    Test that the delay embedding operator matches the products with the
+    materialized delay-embedded matrix.
+    """
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(4, 12))
+    H = apply_delay_embedding_np(X, d)
+    H_op = delay_embedding_operator(X, d)
+    v = rng.normal(size=(H.shape[1], 3))
+    u = rng.normal(size=(H.shape[0], 3))
+    assert H_op.shape == H.shape, "Expected operator shape to match matrix shape"
+    assert H_op.dtype == H.dtype, "Expected operator dtype to match matrix dtype"
+    assert np.allclose(H_op @ v, H @ v), "Expected matvec to match matrix product"
+    assert np.allclose(
+        H_op.T @ u, H.T @ u
+    ), "Expected rmatvec to match transposed matrix product"
+
+
+def test_delay_embedding_operator_integer_input():
+    """Test that the delay embedding operator of integer data is floating point."""
+    X = np.arange(12).reshape(3, 4)
+    H_op = delay_embedding_operator(X, 2)
+    v = np.ones(H_op.shape[1])
+    assert H_op.dtype == np.float64, f"Expected float64 operator, got {H_op.dtype}"
+    assert np.allclose(
+        H_op @ v, apply_delay_embedding_np(X, 2) @ v
+    ), "Expected matvec to match matrix product"
+
+
 @pytest.mark.parametrize(
     "mock_data", ["mock_era5_temperature", "mock_era5_temperature_wind"]
 )
@@ -333,6 +483,42 @@ def test_flatten_era5_variables_array_dims(mock_era5_temperature_wind):
         )
 
 
+def test_flatten_era5_variables_dask(mock_era5_temperature_wind):
+    """
+    Test that flattening a dask-backed dataset gives the same result
+    as flattening the in-memory dataset.
+    """
+    da = flatten_era5_variables(mock_era5_temperature_wind)
+    da_dask = flatten_era5_variables(
+        mock_era5_temperature_wind.chunk({"time": 5, "latitude": 10})
+    )
+    assert isinstance(da_dask.data, np.ndarray), "Expected an in-memory array"
+    assert da_dask.identical(da), "Expected dask-backed result to match"
+
+
+@pytest.mark.parametrize("use_dask", [False, True])
+def test_flatten_era5_variables_broadcast(mock_era5_temperature_wind, use_dask):
+    """
+    Test that variables without a level dimension are broadcast across levels,
+    matching the result of stacking the spatial dimensions.
+    """
+    ds = mock_era5_temperature_wind.copy()
+    ds["surface_pressure"] = ds["temperature"].isel(level=0, drop=True)
+    if use_dask:
+        ds = ds.chunk({"time": 5, "latitude": 10})
+    da = flatten_era5_variables(ds)
+    stacked = ds.stack(space=["level", "latitude", "longitude"])
+    expected = np.concatenate(
+        [stacked[var].transpose("space", "time").values for var in ds.data_vars]
+    )
+    assert da.shape == expected.shape, "Expected shape to match stacking"
+    assert np.array_equal(da.values, expected), "Expected data to match stacking"
+    assert np.array_equal(
+        da.coords["space"].values,
+        np.tile(stacked.coords["space"].values, len(ds.data_vars)),
+    ), "Expected space coordinate to match stacking"
+
+
 @pytest.mark.dependency(
     name="test_flatten_era5_variables_no_time_coord",
     depends=["test_standardize_data"],
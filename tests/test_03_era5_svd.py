@@ -5,15 +5,31 @@ Tests for the era5_svd module.
 import os
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 import xarray as xr
 from pyprojroot import here
 
 from dmd_era5 import config_parser
 from dmd_era5.create_mock_data import create_mock_era5, create_mock_era5_svd
-from dmd_era5.era5_svd import combine_svd_results, retrieve_era5_slice, svd_on_era5
+from dmd_era5.era5_download import (
+    add_config_attributes as add_config_attributes_era5_download,
+)
+from dmd_era5.era5_svd import (
+    combine_svd_results,
+    repeat_along_space,
+    retrieve_era5_slice,
+    svd_on_era5,
+)
+from dmd_era5.era5_svd import (
+    era5_svd as era5_svd_module,
+)
+from dmd_era5.era5_svd import (
+    main as era5_svd_main,
+)
 from dmd_era5.slice_tools import (
     apply_delay_embedding,
+    delay_embedding_operator,
     flatten_era5_variables,
     standardize_data,
 )
@@ -68,6 +84,43 @@ def mock_era5_svd():
     )
 
 
+@pytest.fixture
+def saved_era5_slice_config(base_config, tmp_path, monkeypatch):
+    """
+    Fixture for an SVD configuration whose (double precision) mock ERA5 slice
+    is saved to a temporary directory, to which the data paths of main are
+    redirected.
+    """
+
+    def tmp_config_parser(config: dict, section: str) -> dict:
+        parsed_config = config_parser(config, section=section)
+        for key in ["save_path", "era5_slice_path", "era5_svd_path"]:
+            parsed_config[key] = str(
+                tmp_path / key / os.path.basename(parsed_config[key])
+            )
+            os.makedirs(os.path.dirname(parsed_config[key]), exist_ok=True)
+        return parsed_config
+
+    monkeypatch.setattr(era5_svd_module, "config_parser", tmp_config_parser)
+    config = {
+        **base_config,
+        "start_datetime": "2019-01-01T00",
+        "end_datetime": "2019-01-01T12",
+        "mean_center": True,
+        "scale": True,
+    }
+    parsed_config = tmp_config_parser(config, section="era5-svd")
+    era5_ds = create_mock_era5(
+        start_datetime=parsed_config["start_datetime"],
+        end_datetime=parsed_config["end_datetime"],
+        variables=parsed_config["variables"],
+        levels=parsed_config["levels"],
+    )
+    era5_ds = add_config_attributes_era5_download(era5_ds, parsed_config)
+    era5_ds.to_netcdf(parsed_config["era5_slice_path"], format="NETCDF4")
+    return config, parsed_config
+
+
 def test_config_parser_basic(base_config):
     parsed_config = config_parser(base_config, section="era5-svd")
     assert isinstance(parsed_config, dict)
@@ -176,6 +229,115 @@ def test_svd_on_era5(base_config, mock_era5_small, svd_type):
     """
 
 
+@pytest.fixture
+def slow_decay_matrix():
+    """
+    Fixture for a data matrix whose 10 leading singular values span four
+    orders of magnitude, followed by a slowly decaying tail.
+    """
+    rng = np.random.default_rng(0)
+    n_samples, n_time = 500, 200
+    U, _ = np.linalg.qr(rng.normal(size=(n_samples, n_time)))
+    V, _ = np.linalg.qr(rng.normal(size=(n_time, n_time)))
+    s = np.concatenate(
+        [np.logspace(0, -4, 10), 1e-4 * np.arange(2, n_time - 8) ** -0.5]
+    )
+    return xr.DataArray((U * s) @ V.T, dims=("space", "time"))
+
+
+@pytest.mark.parametrize(
+    ("n_iter", "accurate"),
+    [(0, False), (era5_svd_module.RANDOMIZED_SVD_N_ITER, True)],
+)
+def test_svd_on_era5_randomized_accuracy(
+    base_config, slow_decay_matrix, monkeypatch, n_iter, accurate
+):
+    """
+    Test that the randomized SVD needs its power iterations to recover the
+    leading singular values of the standard SVD, for a data matrix whose
+    spectrum decays slowly past the leading components.
+    """
+    monkeypatch.setattr(era5_svd_module, "RANDOMIZED_SVD_N_ITER", n_iter)
+    parsed_config = config_parser(base_config, section="era5-svd")
+    _, s_standard, _ = svd_on_era5(
+        slow_decay_matrix, {**parsed_config, "svd_type": "standard"}
+    )
+    _, s_randomized, _ = svd_on_era5(
+        slow_decay_matrix, {**parsed_config, "svd_type": "randomized"}
+    )
+    assert np.allclose(s_randomized, s_standard, rtol=1e-4, atol=0) == accurate, f"""
+    Expected singular values to match only with power iterations,
+    got {s_randomized} and {s_standard} with n_iter={n_iter}
+    """
+
+
+def test_svd_on_era5_linear_operator(base_config):
+    """
+    Test that the randomized SVD of a delay embedding operator matches the
+    standard SVD of the materialized delay-embedded data.
+    """
+    parsed_config = config_parser(base_config, section="era5-svd")
+    d = parsed_config["delay_embedding"]
+    n_components = parsed_config["n_components"]
+    # The delay embedding of a rank r data matrix has rank at most r * d
+    rng = np.random.default_rng(0)
+    rank = n_components // d
+    X = (rng.normal(size=(300, rank)) * np.logspace(2, 0, rank)) @ rng.normal(
+        size=(rank, 40)
+    )
+    data = xr.DataArray(
+        X,
+        dims=("space", "time"),
+        coords={
+            "space": np.arange(300),
+            "time": np.arange(40),
+            "original_variable": ("space", np.full(300, "temperature")),
+        },
+    )
+    _, s_standard, _ = svd_on_era5(
+        apply_delay_embedding(data, d), {**parsed_config, "svd_type": "standard"}
+    )
+    U, s, V = svd_on_era5(delay_embedding_operator(X, d), parsed_config)
+    assert U.shape == (X.shape[0] * d, n_components)
+    assert V.shape == (n_components, X.shape[1] - d + 1)
+    assert np.allclose(s, s_standard), f"""
+    Expected singular values to match, got {s} and {s_standard}
+    """
+
+
+def test_svd_on_era5_linear_operator_standard(base_config):
+    """Test that the standard SVD of a linear operator raises an error."""
+    parsed_config = config_parser(
+        {**base_config, "svd_type": "standard"}, section="era5-svd"
+    )
+    with pytest.raises(ValueError, match="not supported for a linear operator"):
+        svd_on_era5(delay_embedding_operator(np.ones((3, 20)), 2), parsed_config)
+
+
+def test_svd_on_era5_linear_operator_too_many_components(base_config):
+    """
+    Test that requesting more components than the smallest dimension
+    of a linear operator raises an error.
+    """
+    parsed_config = config_parser(base_config, section="era5-svd")
+    with pytest.raises(ValueError, match="exceeds the smallest"):
+        svd_on_era5(delay_embedding_operator(np.ones((2, 20)), 2), parsed_config)
+
+
+@pytest.mark.parametrize("repeats", [2, 3])
+def test_repeat_along_space(mock_era5_small, repeats):
+    """
+    Test that repeat_along_space matches concatenating copies of
+    a flattened field along the space dimension.
+    """
+    _, ds_mean, _ = standardize_data(mock_era5_small)
+    da_mean = flatten_era5_variables(ds_mean)
+    da_repeated = repeat_along_space(da_mean, repeats)
+    assert da_repeated.identical(
+        xr.concat([da_mean] * repeats, dim="space")
+    ), "Expected repeated field to match concatenated copies"
+
+
 def test_combine_svd_results(mock_era5_svd):
     """Test the combine_svd_results function."""
     U, s, V, coords, _ = mock_era5_svd
@@ -225,6 +387,24 @@ def test_combine_svd_results_with_original_data(mock_era5_svd):
     """
 
 
+def test_era5_svd_main_data_matrix_dtype(saved_era5_slice_config):
+    """
+    Test that main saves the data matrix in single precision, while
+    performing the SVD of double precision data in double precision.
+    """
+    config, parsed_config = saved_era5_slice_config
+    ds, _, _ = era5_svd_main(config, write_to_netcdf=True)
+    assert ds.X.dtype == np.float32, f"Expected X to be float32, got {ds.X.dtype}"
+    assert ds.U.dtype == np.float64, f"Expected U to be float64, got {ds.U.dtype}"
+    with xr.open_dataset(parsed_config["save_path"]) as saved_ds:
+        assert (
+            saved_ds.X.dtype == np.float32
+        ), f"Expected saved X to be float32, got {saved_ds.X.dtype}"
+        assert np.array_equal(
+            saved_ds.X.values, ds.X.values
+        ), "Expected saved X to match the returned X"
+
+
 def test_retrieve_era5_slice_without_dvc(base_config):
     """
     Test retrieve_era5_slice returns None if the